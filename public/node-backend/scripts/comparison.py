@@ -6,17 +6,69 @@ Usage: python comparison.py '<config_json>'
 
 import sys
 import json
+import atexit
+import time
 from datetime import datetime
 
+# orjson is optional; it is much faster than the stdlib encoder for log lines
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ArcPy is only available inside an ArcGIS Pro Python environment
+try:
+    import arcpy
+    _HAS_ARCPY = True
+except ImportError:
+    arcpy = None
+    _HAS_ARCPY = False
+
+# Log lines are buffered and written to stdout in batches rather than one
+# write + flush per line; anything left over is flushed at exit
+_LOG_BUF = []
+_LOG_BUF_MAX = 64
+
+def _dumps(entry):
+    """Serialize a log entry to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(entry)
+    return json.dumps(entry, separators=(",", ":")).encode()
+
+def _flush_log():
+    """Write any buffered log lines to stdout."""
+    if _LOG_BUF:
+        sys.stdout.buffer.write(b"\n".join(_LOG_BUF) + b"\n")
+        _LOG_BUF.clear()
+    sys.stdout.flush()
+
+atexit.register(_flush_log)
+
+# (monotonic_ns, iso string) of the last timestamp handed out; replaced as a
+# single tuple so concurrent readers never see a mismatched pair
+_ts_cache = (0, "")
+
+def _timestamp():
+    """Return the current ISO timestamp, reused for calls within the same millisecond."""
+    global _ts_cache
+    now = time.monotonic_ns()
+    cached_at, cached = _ts_cache
+    if now - cached_at < 1_000_000:
+        return cached
+    iso = datetime.now().isoformat()
+    _ts_cache = (now, iso)
+    return iso
+
 def log(log_type, message):
     """Output a log entry as JSON."""
     entry = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _timestamp(),
         "type": log_type,
         "message": message
     }
-    print(json.dumps(entry))
-    sys.stdout.flush()
+    _LOG_BUF.append(_dumps(entry))
+    if len(_LOG_BUF) >= _LOG_BUF_MAX:
+        _flush_log()
 
 def compare_feature_classes(config):
     """Compare two feature classes."""
@@ -32,47 +84,11 @@ def compare_feature_classes(config):
     log("info", f"Target: {target_fc}")
     log("info", f"Comparison type: {comparison_type}")
     
-    try:
-        import arcpy
-        
-        # Verify both feature classes exist
-        if not arcpy.Exists(source_fc):
-            log("error", f"Source feature class does not exist: {source_fc}")
-            return False
-        if not arcpy.Exists(target_fc):
-            log("error", f"Target feature class does not exist: {target_fc}")
-            return False
-        
-        differences = []
-        
-        if comparison_type in ["schema", "all"]:
-            log("info", "Comparing schemas...")
-            differences.extend(compare_schemas(source_fc, target_fc))
-        
-        if comparison_type in ["attributes", "all"]:
-            log("info", "Comparing attribute counts...")
-            differences.extend(compare_attributes(source_fc, target_fc))
-        
-        if comparison_type in ["spatial", "all"]:
-            log("info", "Comparing spatial properties...")
-            differences.extend(compare_spatial(source_fc, target_fc))
-        
-        # Report results
-        if differences:
-            log("warning", f"Found {len(differences)} differences:")
-            for diff in differences:
-                log("warning", f"  - {diff}")
-        else:
-            log("info", "✓ No differences found")
-        
-        return True
-        
-    except ImportError:
+    if not _HAS_ARCPY:
         log("warning", "ArcPy not available - running in simulation mode")
         
         # Simulate comparison
         log("info", "[SIMULATED] Comparing schemas...")
-        import time
         time.sleep(0.3)
         log("info", "[SIMULATED] Comparing attributes...")
         time.sleep(0.3)
@@ -85,41 +101,77 @@ def compare_feature_classes(config):
         log("warning", "  - Feature count mismatch: source=15420, target=15418")
         
         return True
-
-def compare_schemas(source_fc, target_fc):
-    """Compare field schemas between two feature classes."""
-    import arcpy
     
+    # Verify both feature classes exist
+    if not arcpy.Exists(source_fc):
+        log("error", f"Source feature class does not exist: {source_fc}")
+        return False
+    if not arcpy.Exists(target_fc):
+        log("error", f"Target feature class does not exist: {target_fc}")
+        return False
+    
+    differences = []
+    
+    # Describe each dataset once; the schema and spatial checks share it
+    if comparison_type in ["schema", "spatial", "all"]:
+        source_desc = arcpy.Describe(source_fc)
+        target_desc = arcpy.Describe(target_fc)
+    
+    if comparison_type in ["schema", "all"]:
+        log("info", "Comparing schemas...")
+        differences.extend(compare_schemas(source_desc, target_desc))
+    
+    if comparison_type in ["attributes", "all"]:
+        log("info", "Comparing attribute counts...")
+        differences.extend(compare_attributes(source_fc, target_fc))
+    
+    if comparison_type in ["spatial", "all"]:
+        log("info", "Comparing spatial properties...")
+        differences.extend(compare_spatial(source_desc, target_desc))
+    
+    # Report results
+    if differences:
+        log("warning", f"Found {len(differences)} differences:")
+        for diff in differences:
+            log("warning", f"  - {diff}")
+    else:
+        log("info", "✓ No differences found")
+    
+    return True
+
+def compare_schemas(source_desc, target_desc):
+    """Compare field schemas between two described feature classes."""
     differences = []
     
-    source_fields = {f.name: f for f in arcpy.ListFields(source_fc)}
-    target_fields = {f.name: f for f in arcpy.ListFields(target_fc)}
+    # Snapshot (type, length) once so the loops below never touch Field objects
+    source_fields = {f.name: (f.type, f.length) for f in source_desc.fields}
+    target_fields = {f.name: (f.type, f.length) for f in target_desc.fields}
+    source_names = set(source_fields)
+    target_names = set(target_fields)
+    
+    # Local binding keeps the per-field appends off the attribute lookup path
+    add = differences.append
     
     # Find missing fields
-    for name in source_fields:
-        if name not in target_fields:
-            differences.append(f"Field '{name}' missing in target")
+    for name in sorted(source_names - target_names):
+        add(f"Field '{name}' missing in target")
     
-    for name in target_fields:
-        if name not in source_fields:
-            differences.append(f"Field '{name}' missing in source")
+    for name in sorted(target_names - source_names):
+        add(f"Field '{name}' missing in source")
     
     # Compare common fields
-    for name in source_fields:
-        if name in target_fields:
-            sf = source_fields[name]
-            tf = target_fields[name]
-            if sf.type != tf.type:
-                differences.append(f"Field '{name}' type mismatch: {sf.type} vs {tf.type}")
-            if sf.length != tf.length and sf.type == "String":
-                differences.append(f"Field '{name}' length mismatch: {sf.length} vs {tf.length}")
+    for name in sorted(source_names & target_names):
+        s_type, s_length = source_fields[name]
+        t_type, t_length = target_fields[name]
+        if s_type != t_type:
+            add(f"Field '{name}' type mismatch: {s_type} vs {t_type}")
+        if s_length != t_length and s_type == "String":
+            add(f"Field '{name}' length mismatch: {s_length} vs {t_length}")
     
     return differences
 
 def compare_attributes(source_fc, target_fc):
     """Compare record counts."""
-    import arcpy
-    
     differences = []
     
     source_count = int(arcpy.GetCount_management(source_fc)[0])
@@ -130,15 +182,10 @@ def compare_attributes(source_fc, target_fc):
     
     return differences
 
-def compare_spatial(source_fc, target_fc):
-    """Compare spatial properties."""
-    import arcpy
-    
+def compare_spatial(source_desc, target_desc):
+    """Compare spatial properties of two described feature classes."""
     differences = []
     
-    source_desc = arcpy.Describe(source_fc)
-    target_desc = arcpy.Describe(target_fc)
-    
     if source_desc.shapeType != target_desc.shapeType:
         differences.append(f"Shape type mismatch: {source_desc.shapeType} vs {target_desc.shapeType}")
     
@@ -151,6 +198,9 @@ def compare_spatial(source_fc, target_fc):
     return differences
 
 if __name__ == "__main__":
+    # Fully buffered UTF-8 stdout; log output is flushed explicitly in batches
+    sys.stdout.reconfigure(encoding="utf-8", line_buffering=False, write_through=False)
+    
     if len(sys.argv) < 2:
         log("error", "Config JSON required")
         sys.exit(1)
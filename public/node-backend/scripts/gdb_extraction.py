@@ -6,24 +6,182 @@ Usage: python gdb_extraction.py '<config_json>'
 
 import sys
 import json
+import atexit
+import time
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+# orjson is optional; it is much faster than the stdlib encoder for log lines
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ArcPy is only available inside an ArcGIS Pro Python environment
+try:
+    import arcpy
+    _HAS_ARCPY = True
+except ImportError:
+    arcpy = None
+    _HAS_ARCPY = False
+
+# Serializes log output so JSON lines from worker threads never interleave
+_log_lock = threading.Lock()
+
+# Log lines are buffered and written to stdout in batches rather than one
+# write + flush per line; anything left over is flushed at exit
+_LOG_BUF = []
+_LOG_BUF_MAX = 64
+
+def _dumps(entry):
+    """Serialize a log entry to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(entry)
+    return json.dumps(entry, separators=(",", ":")).encode()
+
+def _flush_log():
+    """Write any buffered log lines to stdout."""
+    if _LOG_BUF:
+        sys.stdout.buffer.write(b"\n".join(_LOG_BUF) + b"\n")
+        _LOG_BUF.clear()
+    sys.stdout.flush()
+
+atexit.register(_flush_log)
+
+# (monotonic_ns, iso string) of the last timestamp handed out; replaced as a
+# single tuple so concurrent readers never see a mismatched pair
+_ts_cache = (0, "")
+
+def _timestamp():
+    """Return the current ISO timestamp, reused for calls within the same millisecond."""
+    global _ts_cache
+    now = time.monotonic_ns()
+    cached_at, cached = _ts_cache
+    if now - cached_at < 1_000_000:
+        return cached
+    iso = datetime.now().isoformat()
+    _ts_cache = (now, iso)
+    return iso
+
 def log(log_type, message):
     """Output a log entry as JSON."""
     entry = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _timestamp(),
         "type": log_type,
         "message": message
     }
-    print(json.dumps(entry))
-    sys.stdout.flush()
+    with _log_lock:
+        _LOG_BUF.append(_dumps(entry))
+        if len(_LOG_BUF) >= _LOG_BUF_MAX:
+            _flush_log()
+
+# arcpy.ListFields type -> AddField type for the subset writer. Shapefiles
+# have no GUID type, so GUIDs are written as 38-character text ("{...}").
+_FIELD_TYPES = {
+    "String": "TEXT",
+    "OID": "LONG",
+    "Integer": "LONG",
+    "SmallInteger": "SHORT",
+    "BigInteger": "BIGINTEGER",
+    "Double": "DOUBLE",
+    "Single": "FLOAT",
+    "Date": "DATE",
+    "DateOnly": "DATE",
+    "GUID": "TEXT",
+    "GlobalID": "TEXT",
+}
+_GUID_LENGTH = 38
+
+def _subset_field_types(source_fields, fields):
+    """
+    Resolve the AddField type of each whitelisted field, rejecting names the
+    source lacks and types a shapefile attribute can't hold (geometry, blob,
+    raster, ...).
+    """
+    types = []
+    for name in fields:
+        field = source_fields.get(name)
+        if field is None:
+            raise ValueError(f"Field '{name}' not found")
+        field_type = _FIELD_TYPES.get(field.type)
+        if field_type is None:
+            raise ValueError(f"Field '{name}' of type {field.type} can't be exported to a shapefile")
+        types.append(field_type)
+    return types
+
+def _write_subset(fc, output_folder, fields, where=None):
+    """
+    Copy only the whitelisted fields of rows matching `where` into a new
+    shapefile through da cursors. Returns the number of rows written.
+    """
+    desc = arcpy.Describe(fc)
+    source_fields = {f.name: f for f in desc.fields}
+    # Validate before creating anything, so a bad whitelist leaves no output
+    field_types = _subset_field_types(source_fields, fields)
+    
+    # Carry Z and M over, or SHAPE@ inserts would silently drop them
+    out_fc = arcpy.management.CreateFeatureclass(
+        output_folder, f"{fc}.shp", desc.shapeType,
+        has_m="ENABLED" if desc.hasM else "DISABLED",
+        has_z="ENABLED" if desc.hasZ else "DISABLED",
+        spatial_reference=desc.spatialReference
+    )[0]
+    for name, field_type in zip(fields, field_types):
+        field = source_fields[name]
+        length = _GUID_LENGTH if field.type in ("GUID", "GlobalID") else field.length
+        arcpy.management.AddField(out_fc, name, field_type, field_length=length)
+    
+    # Shapefiles truncate field names, so read back the names actually created
+    out_fields = [f.name for f in arcpy.ListFields(out_fc)][-len(fields):]
+    
+    count = 0
+    with arcpy.da.SearchCursor(fc, ["SHAPE@"] + fields, where_clause=where) as rows, \
+            arcpy.da.InsertCursor(out_fc, ["SHAPE@"] + out_fields) as out:
+        insert_row = out.insertRow
+        for row in rows:
+            insert_row(row)
+            count += 1
+    return count
+
+def _extract_one(fc, output_folder, fields=None, where=None):
+    """
+    Extract a single feature class. Returns (fc, count, error).
+    
+    With a `fields` whitelist only those columns (and rows matching `where`)
+    are written; a `where` alone exports every column of the matching rows;
+    otherwise the whole feature class goes through FeatureClassToShapefile.
+    """
+    try:
+        log("info", f"Extracting: {fc}")
+        if fields:
+            count = _write_subset(fc, output_folder, fields, where)
+            return fc, count, None
+        
+        if where:
+            out_fc = arcpy.conversion.FeatureClassToFeatureClass(
+                fc, output_folder, f"{fc}.shp", where
+            )[0]
+            count = int(arcpy.GetCount_management(out_fc)[0])
+            return fc, count, None
+        
+        arcpy.conversion.FeatureClassToShapefile(fc, output_folder)
+        
+        # Get feature count
+        count = int(arcpy.GetCount_management(fc)[0])
+        return fc, count, None
+    except Exception as e:
+        return fc, 0, e
 
 def extract_feature_classes(config):
     """Extract feature classes from GDB to shapefiles."""
     source_path = config.get("sourcePath", "")
     output_folder = config.get("outputFolder", "")
     feature_classes = config.get("featureClasses", [])
+    workers = max(1, int(config.get("workers", 4)))
+    fields = config.get("fields") or None
+    where = config.get("where") or None
     
     if not source_path or not output_folder:
         log("error", "Source path and output folder are required")
@@ -33,53 +191,55 @@ def extract_feature_classes(config):
     log("info", f"Output folder: {output_folder}")
     log("info", f"Feature classes to extract: {len(feature_classes)}")
     
-    try:
-        import arcpy
-        
-        # Create output folder if it doesn't exist
-        if not os.path.exists(output_folder):
-            os.makedirs(output_folder)
-            log("info", f"Created output folder: {output_folder}")
-        
-        arcpy.env.workspace = source_path
-        arcpy.env.overwriteOutput = True
-        
-        # If no feature classes specified, extract all
-        if not feature_classes:
-            feature_classes = arcpy.ListFeatureClasses() or []
-            log("info", f"No feature classes specified, extracting all {len(feature_classes)} found")
-        
-        extracted = 0
-        for fc in feature_classes:
-            try:
-                log("info", f"Extracting: {fc}")
-                output_path = os.path.join(output_folder, f"{fc}.shp")
-                arcpy.conversion.FeatureClassToShapefile(fc, output_folder)
-                
-                # Get feature count
-                count = int(arcpy.GetCount_management(fc)[0])
-                log("info", f"✓ Extracted {fc} ({count} features)")
-                extracted += 1
-            except Exception as e:
-                log("error", f"Failed to extract {fc}: {str(e)}")
-        
-        log("info", f"Extraction complete: {extracted}/{len(feature_classes)} feature classes")
-        return True
-        
-    except ImportError:
+    if not _HAS_ARCPY:
         log("warning", "ArcPy not available - running in simulation mode")
         
         # Simulate extraction
         for i, fc in enumerate(feature_classes or ["Parcels", "Roads", "Buildings"]):
             log("info", f"[SIMULATED] Extracting: {fc}")
-            import time
             time.sleep(0.5)
             log("info", f"✓ [SIMULATED] Extracted {fc}")
         
         log("info", "[SIMULATED] Extraction complete")
         return True
+    
+    # Create output folder if it doesn't exist
+    os.makedirs(output_folder, exist_ok=True)
+    
+    arcpy.env.workspace = source_path
+    arcpy.env.overwriteOutput = True
+    # Plain field names; skips qualified-name handling during conversion
+    arcpy.env.qualifiedFieldNames = False
+    
+    # If no feature classes specified, extract all
+    if not feature_classes:
+        feature_classes = arcpy.ListFeatureClasses() or []
+        log("info", f"No feature classes specified, extracting all {len(feature_classes)} found")
+    
+    extracted = 0
+    # Local bindings for the submit/result loops
+    _log = log
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        submit = pool.submit
+        futures = [
+            submit(_extract_one, fc, output_folder, fields, where)
+            for fc in feature_classes
+        ]
+        for future in as_completed(futures):
+            fc, count, error = future.result()
+            if error is None:
+                _log("info", f"✓ Extracted {fc} ({count} features)")
+                extracted += 1
+            else:
+                _log("error", f"Failed to extract {fc}: {str(error)}")
+    
+    log("info", f"Extraction complete: {extracted}/{len(feature_classes)} feature classes")
+    return True
 
 if __name__ == "__main__":
+    # Fully buffered UTF-8 stdout; log output is flushed explicitly in batches
+    sys.stdout.reconfigure(encoding="utf-8", line_buffering=False, write_through=False)
+    
     if len(sys.argv) < 2:
         log("error", "Config JSON required")
         sys.exit(1)
@@ -7,55 +7,25 @@ Usage: python list_feature_classes.py <gdb_path>
 import sys
 import json
 
+# ArcPy is only available inside an ArcGIS Pro Python environment
+try:
+    import arcpy
+    _HAS_ARCPY = True
+except ImportError:
+    arcpy = None
+    _HAS_ARCPY = False
+
+def count_rows(dataset):
+    """Row count from GetCount's stored count, falling back to an OID cursor scan."""
+    try:
+        return int(arcpy.management.GetCount(dataset).getOutput(0))
+    except Exception:
+        with arcpy.da.SearchCursor(dataset, ["OID@"]) as cursor:
+            return sum(1 for _ in cursor)
+
 def list_feature_classes(gdb_path):
     """List all feature classes and tables in a geodatabase."""
-    try:
-        import arcpy
-        arcpy.env.workspace = gdb_path
-        
-        feature_classes = []
-        tables = []
-        
-        # List feature classes
-        for fc in arcpy.ListFeatureClasses() or []:
-            try:
-                count = int(arcpy.GetCount_management(fc)[0])
-                desc = arcpy.Describe(fc)
-                feature_classes.append({
-                    "name": fc,
-                    "type": desc.shapeType,
-                    "count": count
-                })
-            except:
-                feature_classes.append({
-                    "name": fc,
-                    "type": "Unknown",
-                    "count": 0
-                })
-        
-        # List tables
-        for table in arcpy.ListTables() or []:
-            try:
-                count = int(arcpy.GetCount_management(table)[0])
-                tables.append({
-                    "name": table,
-                    "type": "Table",
-                    "count": count
-                })
-            except:
-                tables.append({
-                    "name": table,
-                    "type": "Table",
-                    "count": 0
-                })
-        
-        return {
-            "featureClasses": feature_classes,
-            "tables": tables,
-            "arcpyAvailable": True
-        }
-    
-    except ImportError:
+    if not _HAS_ARCPY:
         # ArcPy not available - return mock data for testing
         return {
             "featureClasses": [
@@ -71,8 +41,75 @@ def list_feature_classes(gdb_path):
             "arcpyAvailable": False,
             "message": "ArcPy not available - showing sample data"
         }
+    
+    arcpy.env.workspace = gdb_path
+    # Skip geoprocessing history writes for the GetCount call per dataset
+    arcpy.SetLogHistory(False)
+    
+    feature_classes = []
+    tables = []
+    
+    # Describe the workspace once and read shape types off its children
+    # rather than opening a Describe per feature class. If that fails (e.g.
+    # a locked child), each feature class falls back to its own Describe.
+    try:
+        shape_types = {
+            child.name: child.shapeType
+            for child in arcpy.Describe(gdb_path).children
+            if child.dataType == "FeatureClass"
+        }
+    except Exception:
+        shape_types = {}
+    
+    # Bind loop-invariant lookups to locals for the per-dataset loops
+    describe = arcpy.Describe
+    get_shape_type = shape_types.get
+    add_fc = feature_classes.append
+    add_table = tables.append
+    
+    # List feature classes
+    for fc in arcpy.ListFeatureClasses() or []:
+        try:
+            count = count_rows(fc)
+            shape_type = get_shape_type(fc) or describe(fc).shapeType
+            add_fc({
+                "name": fc,
+                "type": shape_type,
+                "count": count
+            })
+        except:
+            add_fc({
+                "name": fc,
+                "type": "Unknown",
+                "count": 0
+            })
+    
+    # List tables
+    for table in arcpy.ListTables() or []:
+        try:
+            count = count_rows(table)
+            add_table({
+                "name": table,
+                "type": "Table",
+                "count": count
+            })
+        except:
+            add_table({
+                "name": table,
+                "type": "Table",
+                "count": 0
+            })
+    
+    return {
+        "featureClasses": feature_classes,
+        "tables": tables,
+        "arcpyAvailable": True
+    }
 
 if __name__ == "__main__":
+    # Fully buffered UTF-8 stdout; the result is written once
+    sys.stdout.reconfigure(encoding="utf-8", line_buffering=False, write_through=False)
+    
     if len(sys.argv) < 2:
         print(json.dumps({"error": "GDB path required"}))
         sys.exit(1)
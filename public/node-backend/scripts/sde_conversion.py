@@ -6,17 +6,122 @@ Usage: python sde_conversion.py '<config_json>'
 
 import sys
 import json
+import atexit
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+# orjson is optional; it is much faster than the stdlib encoder for log lines
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ArcPy is only available inside an ArcGIS Pro Python environment
+try:
+    import arcpy
+    _HAS_ARCPY = True
+except ImportError:
+    arcpy = None
+    _HAS_ARCPY = False
+
+# Serializes log output so JSON lines from worker threads never interleave
+_log_lock = threading.Lock()
+
+# Log lines are buffered and written to stdout in batches rather than one
+# write + flush per line; anything left over is flushed at exit
+_LOG_BUF = []
+_LOG_BUF_MAX = 64
+
+def _dumps(entry):
+    """Serialize a log entry to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(entry)
+    return json.dumps(entry, separators=(",", ":")).encode()
+
+def _flush_log():
+    """Write any buffered log lines to stdout."""
+    if _LOG_BUF:
+        sys.stdout.buffer.write(b"\n".join(_LOG_BUF) + b"\n")
+        _LOG_BUF.clear()
+    sys.stdout.flush()
+
+atexit.register(_flush_log)
+
+# (monotonic_ns, iso string) of the last timestamp handed out; replaced as a
+# single tuple so concurrent readers never see a mismatched pair
+_ts_cache = (0, "")
+
+def _timestamp():
+    """Return the current ISO timestamp, reused for calls within the same millisecond."""
+    global _ts_cache
+    now = time.monotonic_ns()
+    cached_at, cached = _ts_cache
+    if now - cached_at < 1_000_000:
+        return cached
+    iso = datetime.now().isoformat()
+    _ts_cache = (now, iso)
+    return iso
+
 def log(log_type, message):
     """Output a log entry as JSON."""
     entry = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _timestamp(),
         "type": log_type,
         "message": message
     }
-    print(json.dumps(entry))
-    sys.stdout.flush()
+    with _log_lock:
+        _LOG_BUF.append(_dumps(entry))
+        if len(_LOG_BUF) >= _LOG_BUF_MAX:
+            _flush_log()
+
+def count_rows(dataset):
+    """Row count from GetCount's result object, falling back to an OID cursor scan."""
+    try:
+        return int(arcpy.management.GetCount(dataset).getOutput(0))
+    except Exception:
+        with arcpy.da.SearchCursor(dataset, ["OID@"]) as cursor:
+            return sum(1 for _ in cursor)
+
+def _convert_one(fc, source_connection, target_connection, truncate_first,
+                 target_exists, verify_count):
+    """
+    Convert a single feature class. Returns (fc, count, error); count is
+    None when verification is turned off.
+    """
+    try:
+        source_fc = f"{source_connection}\\{fc}"
+        target_fc = f"{target_connection}\\{fc}"
+        
+        log("info", f"Processing: {fc}")
+        
+        # Truncate target if requested
+        if truncate_first:
+            try:
+                arcpy.management.TruncateTable(target_fc)
+                log("info", f"  Truncated target: {fc}")
+            except:
+                log("warning", f"  Could not truncate {fc} (may not exist)")
+        
+        # Check if target exists (resolved up front from the target listing)
+        if not target_exists:
+            # Copy schema and data
+            arcpy.conversion.FeatureClassToFeatureClass(
+                source_fc,
+                target_connection,
+                fc
+            )
+            log("info", f"  Created and populated: {fc}")
+        else:
+            # Append data
+            arcpy.management.Append(source_fc, target_fc, "NO_TEST")
+            log("info", f"  Appended to: {fc}")
+        
+        count = count_rows(target_fc) if verify_count else None
+        return fc, count, None
+    except Exception as e:
+        return fc, 0, e
 
 def convert_sde(config):
     """Convert feature classes from source SDE to target SDE."""
@@ -24,6 +129,8 @@ def convert_sde(config):
     target_connection = config.get("targetConnection", "")
     feature_classes = config.get("featureClasses", [])
     truncate_first = config.get("truncateFirst", False)
+    workers = max(1, int(config.get("workers", 4)))
+    verify_count = config.get("verifyCount", False)
     
     if not source_connection or not target_connection:
         log("error", "Source and target connections are required")
@@ -34,58 +141,12 @@ def convert_sde(config):
     log("info", f"Truncate before load: {truncate_first}")
     log("info", f"Feature classes to convert: {len(feature_classes)}")
     
-    try:
-        import arcpy
-        
-        arcpy.env.overwriteOutput = True
-        
-        converted = 0
-        for fc in feature_classes:
-            try:
-                source_fc = f"{source_connection}\\{fc}"
-                target_fc = f"{target_connection}\\{fc}"
-                
-                log("info", f"Processing: {fc}")
-                
-                # Truncate target if requested
-                if truncate_first:
-                    try:
-                        arcpy.management.TruncateTable(target_fc)
-                        log("info", f"  Truncated target: {fc}")
-                    except:
-                        log("warning", f"  Could not truncate {fc} (may not exist)")
-                
-                # Check if target exists
-                if not arcpy.Exists(target_fc):
-                    # Copy schema and data
-                    arcpy.conversion.FeatureClassToFeatureClass(
-                        source_fc,
-                        target_connection,
-                        fc
-                    )
-                    log("info", f"  Created and populated: {fc}")
-                else:
-                    # Append data
-                    arcpy.management.Append(source_fc, target_fc, "NO_TEST")
-                    log("info", f"  Appended to: {fc}")
-                
-                count = int(arcpy.GetCount_management(target_fc)[0])
-                log("info", f"✓ Completed {fc} ({count} features)")
-                converted += 1
-                
-            except Exception as e:
-                log("error", f"Failed to convert {fc}: {str(e)}")
-        
-        log("info", f"Conversion complete: {converted}/{len(feature_classes)} feature classes")
-        return True
-        
-    except ImportError:
+    if not _HAS_ARCPY:
         log("warning", "ArcPy not available - running in simulation mode")
         
         # Simulate conversion
         for fc in feature_classes or ["Parcels", "Roads", "Utilities"]:
             log("info", f"[SIMULATED] Processing: {fc}")
-            import time
             time.sleep(0.5)
             if truncate_first:
                 log("info", f"  [SIMULATED] Truncated target: {fc}")
@@ -93,8 +154,44 @@ def convert_sde(config):
         
         log("info", "[SIMULATED] Conversion complete")
         return True
+    
+    arcpy.env.overwriteOutput = True
+    
+    # List the target root once so most existing feature classes skip an
+    # Exists round-trip. Names must match exactly (owner qualifier included);
+    # anything not listed, such as a class inside a feature dataset, still
+    # gets an Exists check.
+    arcpy.env.workspace = target_connection
+    target_names = {name.lower() for name in arcpy.ListFeatureClasses() or []}
+    
+    converted = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _convert_one, fc, source_connection, target_connection, truncate_first,
+                fc.lower() in target_names or arcpy.Exists(f"{target_connection}\\{fc}"),
+                verify_count
+            )
+            for fc in feature_classes
+        ]
+        for future in as_completed(futures):
+            fc, count, error = future.result()
+            if error is None:
+                if count is None:
+                    log("info", f"✓ Completed {fc}")
+                else:
+                    log("info", f"✓ Completed {fc} ({count} features)")
+                converted += 1
+            else:
+                log("error", f"Failed to convert {fc}: {str(error)}")
+    
+    log("info", f"Conversion complete: {converted}/{len(feature_classes)} feature classes")
+    return True
 
 if __name__ == "__main__":
+    # Fully buffered UTF-8 stdout; log output is flushed explicitly in batches
+    sys.stdout.reconfigure(encoding="utf-8", line_buffering=False, write_through=False)
+    
     if len(sys.argv) < 2:
         log("error", "Config JSON required")
         sys.exit(1)
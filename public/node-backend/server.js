@@ -724,15 +724,26 @@ async function runPythonJob(jobId, jobType, config, callbackUrl) {
 
   const pythonProcess = spawn(pythonPath, [scriptPath, JSON.stringify(config)]);
 
+  const pushLogLine = (line) => {
+    if (!line.trim()) return;
+    try {
+      const logEntry = JSON.parse(line);
+      job.logs.push(logEntry);
+    } catch {
+      job.logs.push({ timestamp: new Date().toISOString(), type: 'info', message: line });
+    }
+  };
+
+  // The scripts write log lines in batches, and a pipe read can end mid-line
+  // (or mid-character), so decode as a UTF-8 stream and carry the incomplete
+  // last line over to the next chunk
+  let stdoutTail = '';
+  pythonProcess.stdout.setEncoding('utf8');
   pythonProcess.stdout.on('data', (data) => {
-    const lines = data.toString().split('\n').filter(l => l.trim());
+    const lines = (stdoutTail + data).split('\n');
+    stdoutTail = lines.pop();
     for (const line of lines) {
-      try {
-        const logEntry = JSON.parse(line);
-        job.logs.push(logEntry);
-      } catch {
-        job.logs.push({ timestamp: new Date().toISOString(), type: 'info', message: line });
-      }
+      pushLogLine(line);
     }
   });
 
@@ -741,6 +752,8 @@ async function runPythonJob(jobId, jobType, config, callbackUrl) {
   });
 
   pythonProcess.on('close', async (code) => {
+    pushLogLine(stdoutTail);
+    stdoutTail = '';
     job.completedAt = new Date().toISOString();
     
     if (code === 0) {
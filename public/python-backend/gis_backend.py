@@ -12,9 +12,12 @@ Requirements:
 - PyJWT
 - bcrypt
 - SQLAlchemy
+- httpx
+- orjson
+- cachetools
 
 Install dependencies:
-    pip install fastapi uvicorn python-multipart requests PyJWT bcrypt sqlalchemy
+    pip install fastapi uvicorn python-multipart httpx orjson cachetools PyJWT bcrypt sqlalchemy
 
 Run the server:
     uvicorn gis_backend:app --host 0.0.0.0 --port 8000 --reload
@@ -25,34 +28,95 @@ Configure the web app:
 
 import os
 import glob
+import stat
 import json
+import time
 import asyncio
 import logging
 import secrets
 import hashlib
+import threading
 from pathlib import Path
-from typing import Optional, List, Literal
+from typing import Optional, List, Literal, Dict, Tuple
 from datetime import datetime, timedelta
+from collections import namedtuple
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Header
+import httpx
+import orjson
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, EmailStr
 
 # JWT and Auth
 import jwt
 import bcrypt
-from sqlalchemy import create_engine, Column, String, DateTime, Boolean
+from sqlalchemy import create_engine, select, Column, String, DateTime, Boolean
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 
+# ArcPy (requires an ArcGIS Pro license) is imported once; the first import
+# is slow, and handlers fall back to errors or mock data without it
+try:
+    import arcpy
+    _HAS_ARCPY = True
+except ImportError:
+    arcpy = None
+    _HAS_ARCPY = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Thread pool for running ArcPy operations (ArcPy is not async-compatible)
-executor = ThreadPoolExecutor(max_workers=4)
+# Thread pool for short blocking I/O done on behalf of a request (DB lookups,
+# directory scans, ArcPy metadata reads); ArcPy is not async-compatible. The
+# work is I/O-bound, so size it above the core count.
+executor = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 2),
+    thread_name_prefix="gis-io"
+)
+
+# Whole /execute jobs can run for hours, so they get a pool of their own and
+# never hold up request-path work on `executor`
+_job_executor = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 2),
+    thread_name_prefix="gis-job"
+)
+
+
+async def _offload(fn, *args, **kwargs):
+    """Run a blocking callable on the executor and await its result"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(fn, *args, **kwargs))
+
+# Password hashing is CPU-bound (bcrypt releases the GIL), so it gets its own
+# core-sized pool rather than occupying the I/O executor's threads
+_auth_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="auth"
+)
+
+
+async def _offload_auth(fn, *args):
+    """Run a password hashing call on the auth pool and await its result"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_auth_executor, fn, *args)
+
+# Shared async HTTP client so callbacks reuse pooled keep-alive connections.
+# The transport retries failed connection attempts, so a dropped keep-alive
+# socket or a brief receiver outage doesn't lose a callback.
+_http = httpx.AsyncClient(
+    timeout=30.0,
+    transport=httpx.AsyncHTTPTransport(
+        retries=3,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    )
+)
 
 # ============================================================================
 # Database Configuration
@@ -71,7 +135,23 @@ JWT_SECRET = os.environ.get("JWT_SECRET", secrets.token_hex(32))
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {})
+# bcrypt work factor for new password hashes; existing hashes keep the cost
+# they were created with
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+
+# Authenticated users are cached briefly so every request doesn't query the
+# database; a deactivation takes effect within this many seconds
+USER_CACHE_TTL_SECONDS = 60
+
+# Pre-ping drops stale pooled connections before use; server databases also
+# get a larger pool with periodic recycling
+engine_options = {"pool_pre_ping": True}
+if "sqlite" in DATABASE_URL:
+    engine_options["connect_args"] = {"check_same_thread": False}
+else:
+    engine_options.update(pool_size=20, max_overflow=40, pool_recycle=1800)
+
+engine = create_engine(DATABASE_URL, **engine_options)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -103,11 +183,19 @@ def get_db():
         db.close()
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
 
 def verify_password(password: str, password_hash: str) -> bool:
     return bcrypt.checkpw(password.encode(), password_hash.encode())
 
+def new_user_id() -> str:
+    """
+    32-char hex user ID: a 48-bit millisecond timestamp followed by 80 random
+    bits. Time-ordered IDs append to the end of the primary key index
+    instead of landing on random pages.
+    """
+    return f"{int(time.time() * 1000):012x}" + secrets.token_hex(10)
+
 def create_token(user_id: str, email: str) -> str:
     payload = {
         "sub": user_id,
@@ -126,6 +214,24 @@ def verify_token(token: str) -> dict:
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+_user_cache = TTLCache(maxsize=1024, ttl=USER_CACHE_TTL_SECONDS)
+
+def get_user_by_id(db: Session, user_id: str) -> Optional[User]:
+    return db.query(User).filter(User.id == user_id).first()
+
+# Email lookups select plain rows through Core against the unique email
+# index, skipping ORM entity construction and the identity map
+_signin_columns = (
+    User.id, User.email, User.password_hash, User.full_name,
+    User.is_active, User.created_at
+)
+
+def get_signin_row(db: Session, email: str):
+    return db.execute(select(*_signin_columns).where(User.email == email)).first()
+
+def email_registered(db: Session, email: str) -> bool:
+    return db.execute(select(User.id).where(User.email == email).limit(1)).first() is not None
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
@@ -133,8 +239,14 @@ async def get_current_user(
     if not credentials:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
+    # Token decoding is cheap; the blocking DB lookup runs on the executor
     payload = verify_token(credentials.credentials)
-    user = db.query(User).filter(User.id == payload["sub"]).first()
+    user_id = payload["sub"]
+    user = _user_cache.get(user_id)
+    if user is None:
+        user = await _offload(get_user_by_id, db, user_id)
+        if user:
+            _user_cache[user_id] = user
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
     if not user.is_active:
@@ -144,7 +256,8 @@ async def get_current_user(
 app = FastAPI(
     title="GIS Automation Hub Backend",
     description="Python backend for GIS automation scripts with ArcPy",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS configuration - adjust origins for your deployment
@@ -157,6 +270,49 @@ app.add_middleware(
 )
 
 
+# Set once the startup warmup has loaded arcpy's geoprocessing toolboxes
+_arcpy_ready = threading.Event()
+
+
+def _warm_up_arcpy():
+    """Pay arcpy's first-tool-call cost up front instead of in the first job"""
+    try:
+        arcpy.env.overwriteOutput = True
+        table = arcpy.management.CreateTable("memory", "warmup")[0]
+        arcpy.management.GetCount(table)
+        arcpy.management.Delete(table)
+        logger.info("ArcPy warmed up")
+    except Exception as e:
+        logger.warning(f"ArcPy warmup failed: {e}")
+    finally:
+        _arcpy_ready.set()
+
+
+def _require_arcpy():
+    """Raise ImportError without arcpy, otherwise wait for the warmup to finish"""
+    if not _HAS_ARCPY:
+        raise ImportError("arcpy is not available")
+    _arcpy_ready.wait()
+
+
+@app.on_event("startup")
+async def start_arcpy_warmup():
+    if _HAS_ARCPY:
+        threading.Thread(target=_warm_up_arcpy, name="arcpy-warmup", daemon=True).start()
+    else:
+        _arcpy_ready.set()
+
+
+@app.on_event("shutdown")
+async def shutdown_executor():
+    """Let in-flight blocking work finish before the process exits"""
+    # Jobs can run for hours, so wait off the event loop; it keeps serving
+    # the callback batcher, which drains only after this hook returns
+    loop = asyncio.get_running_loop()
+    for pool in (executor, _job_executor, _auth_executor):
+        await loop.run_in_executor(None, partial(pool.shutdown, wait=True))
+
+
 # ============================================================================
 # Request/Response Models
 # ============================================================================
@@ -198,8 +354,13 @@ class LogEntry(BaseModel):
 # File Browser Endpoint
 # ============================================================================
 
-def get_available_drives() -> List[str]:
-    """Get list of available drives on Windows"""
+# Drive layout rarely changes, so probe it at most once per this many seconds
+DRIVES_CACHE_SECONDS = 5
+
+
+@lru_cache(maxsize=1)
+def _probe_drives(bucket: int) -> tuple:
+    """Probe available drives; `bucket` only keys the cache to a time window"""
     drives = []
     if os.name == 'nt':  # Windows
         import string
@@ -209,7 +370,12 @@ def get_available_drives() -> List[str]:
                 drives.append(drive)
     else:  # Unix/Linux
         drives = ["/"]
-    return drives
+    return tuple(drives)
+
+
+def get_available_drives() -> List[str]:
+    """Get list of available drives on Windows"""
+    return list(_probe_drives(int(time.monotonic() // DRIVES_CACHE_SECONDS)))
 
 
 def is_geodatabase(path: str) -> bool:
@@ -222,7 +388,72 @@ def is_sde_connection(path: str) -> bool:
     return path.lower().endswith('.sde') and os.path.isfile(path)
 
 
-@app.post("/browse", response_model=BrowseResponse)
+def _scan_dir(path: str, filter_type: str) -> List[dict]:
+    """
+    Scan a directory for browsable items.
+    
+    Blocking filesystem work, so callers run it on the executor. GDB/SDE
+    detection relies on the DirEntry's cached type instead of re-statting.
+    Items are plain dicts matching FileItem's fields; they are already
+    well-typed, so the caller builds models without re-validating them.
+    """
+    items: List[dict] = []
+    
+    for entry in os.scandir(path):
+        try:
+            item_path = entry.path
+            item_name = entry.name
+            low = item_name.lower()
+            is_dir = entry.is_dir()
+            
+            # Determine item type
+            if low.endswith('.gdb') and is_dir:
+                item_type = "gdb"
+            elif low.endswith('.sde') and not is_dir:
+                item_type = "sde"
+            elif is_dir:
+                item_type = "folder"
+            else:
+                item_type = "file"
+                # Skip non-relevant files unless showing all
+                if filter_type != "all":
+                    continue
+            
+            # Apply type filter
+            if filter_type != "all" and item_type not in [filter_type, "folder"]:
+                continue
+            
+            # Get file stats
+            try:
+                st = entry.stat()
+                size = st.st_size if not is_dir else None
+                modified = datetime.fromtimestamp(st.st_mtime).isoformat()
+            except:
+                size = None
+                modified = None
+            
+            items.append({
+                "name": item_name,
+                "path": item_path,
+                "type": item_type,
+                "size": size,
+                "modified": modified
+            })
+            
+        except PermissionError:
+            continue
+        except Exception as e:
+            logger.warning(f"Error reading {entry.path}: {e}")
+            continue
+    
+    # Sort: folders first, then by name
+    items.sort(key=lambda x: (0 if x["type"] == "folder" else 1, x["name"].lower()))
+    return items
+
+
+# No response_model: FastAPI would re-validate every item on the way out.
+# The schema is still documented through `responses`.
+@app.post("/browse", responses={200: {"model": BrowseResponse}})
 async def browse_filesystem(request: BrowseRequest):
     """
     Browse the server filesystem for GDBs, SDEs, and folders.
@@ -252,67 +483,21 @@ async def browse_filesystem(request: BrowseRequest):
     if not os.path.isdir(path):
         raise HTTPException(status_code=400, detail="Path must be a directory")
     
-    items: List[FileItem] = []
-    
     try:
-        for entry in os.scandir(path):
-            try:
-                item_path = entry.path
-                item_name = entry.name
-                
-                # Determine item type
-                if is_geodatabase(item_path):
-                    item_type = "gdb"
-                elif is_sde_connection(item_path):
-                    item_type = "sde"
-                elif entry.is_dir():
-                    item_type = "folder"
-                else:
-                    item_type = "file"
-                    # Skip non-relevant files unless showing all
-                    if filter_type != "all":
-                        continue
-                
-                # Apply type filter
-                if filter_type != "all" and item_type not in [filter_type, "folder"]:
-                    continue
-                
-                # Get file stats
-                try:
-                    stat = entry.stat()
-                    size = stat.st_size if not entry.is_dir() else None
-                    modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
-                except:
-                    size = None
-                    modified = None
-                
-                items.append(FileItem(
-                    name=item_name,
-                    path=item_path,
-                    type=item_type,
-                    size=size,
-                    modified=modified
-                ))
-                
-            except PermissionError:
-                continue
-            except Exception as e:
-                logger.warning(f"Error reading {entry.path}: {e}")
-                continue
-        
-        # Sort: folders first, then by name
-        items.sort(key=lambda x: (0 if x.type == "folder" else 1, x.name.lower()))
+        items = await _offload(_scan_dir, path, filter_type)
         
         # Get parent path
         parent = os.path.dirname(path)
         parent_path = parent if parent != path else None
         
-        return BrowseResponse(
-            current_path=path,
-            parent_path=parent_path,
-            items=items,
-            drives=get_available_drives()
-        )
+        # Serialize the scanned dicts directly; _scan_dir only produces
+        # values that already match FileItem
+        return ORJSONResponse(content={
+            "current_path": path,
+            "parent_path": parent_path,
+            "items": items,
+            "drives": get_available_drives()
+        })
         
     except PermissionError:
         raise HTTPException(status_code=403, detail="Permission denied")
@@ -328,8 +513,6 @@ async def browse_filesystem(request: BrowseRequest):
 async def send_callback(callback_url: str, job_id: str, status: str, 
                         logs: List[dict] = None, result: dict = None):
     """Send status update to the callback URL"""
-    import requests
-    
     payload = {
         "jobId": job_id,
         "status": status,
@@ -340,13 +523,122 @@ async def send_callback(callback_url: str, job_id: str, status: str,
         payload["result"] = result
     
     try:
-        response = requests.post(callback_url, json=payload, timeout=30)
+        # orjson encodes large log batches far faster than httpx's stdlib json
+        response = await _http.post(
+            callback_url,
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"}
+        )
         response.raise_for_status()
         logger.info(f"Callback sent for job {job_id}: {status}")
     except Exception as e:
         logger.error(f"Failed to send callback for job {job_id}: {e}")
 
 
+class CallbackBatcher:
+    """
+    Coalesces job callbacks into batched POSTs.
+    
+    Job handlers run on worker threads and queue updates with `submit()`.
+    A background task collects "running" log entries per job and sends them
+    as one callback per `max_batch` entries or every `interval` seconds,
+    with different jobs dispatched concurrently. A terminal status (success
+    or failed) flushes that job's pending logs in the same request, so the
+    final status always lands after the job's progress updates.
+    
+    The callback receiver appends the logs it is sent, so every entry is
+    sent exactly once.
+    """
+    
+    def __init__(self, max_batch: int = 50, interval: float = 0.25):
+        self.max_batch = max_batch
+        self.interval = interval
+        self.queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        # Running total of entries held in `_run`'s pending buffers, so the
+        # batch-size check is O(1) per item rather than a sum over every job
+        self._pending_count = 0
+    
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+        self._task = self._loop.create_task(self._run())
+    
+    async def stop(self):
+        """Send everything still queued, then stop the background task"""
+        # Same path as submit() so the sentinel cannot overtake pending items
+        self._loop.call_soon_threadsafe(self.queue.put_nowait, None)
+        await self._task
+    
+    def submit(self, callback_url: str, job_id: str, status: str = "running",
+               logs: List[dict] = None, result: dict = None):
+        """Queue a callback update (thread-safe)"""
+        item = (callback_url, job_id, status, logs or [], result)
+        self._loop.call_soon_threadsafe(self.queue.put_nowait, item)
+    
+    async def _flush(self, pending: Dict[Tuple[str, str], List[dict]]):
+        await asyncio.gather(*(
+            send_callback(callback_url, job_id, "running", logs)
+            for (callback_url, job_id), logs in pending.items()
+        ))
+        pending.clear()
+        self._pending_count = 0
+    
+    async def _run(self):
+        pending: Dict[Tuple[str, str], List[dict]] = {}
+        deadline = 0.0
+        
+        while True:
+            try:
+                if pending:
+                    timeout = max(0.0, deadline - self._loop.time())
+                    item = await asyncio.wait_for(self.queue.get(), timeout=timeout)
+                else:
+                    item = await self.queue.get()
+            except asyncio.TimeoutError:
+                await self._flush(pending)
+                continue
+            
+            if item is None:
+                await self._flush(pending)
+                return
+            
+            callback_url, job_id, status, logs, result = item
+            key = (callback_url, job_id)
+            if not pending:
+                deadline = self._loop.time() + self.interval
+            
+            if status != "running":
+                buffered = pending.pop(key, None)
+                if buffered:
+                    self._pending_count -= len(buffered)
+                    buffered.extend(logs)
+                    logs = buffered
+                await send_callback(callback_url, job_id, status, logs, result)
+                continue
+            
+            pending.setdefault(key, []).extend(logs)
+            self._pending_count += len(logs)
+            if self._pending_count >= self.max_batch:
+                await self._flush(pending)
+
+
+callback_batcher = CallbackBatcher()
+
+
+@app.on_event("startup")
+async def start_callback_batcher():
+    callback_batcher.start()
+
+
+@app.on_event("shutdown")
+async def stop_callback_batcher():
+    """Drain queued callbacks, then close the shared HTTP client"""
+    await callback_batcher.stop()
+    await _http.aclose()
+
+
 def create_log(msg_type: str, message: str) -> dict:
     """Create a log entry"""
     return {
@@ -356,31 +648,147 @@ def create_log(msg_type: str, message: str) -> dict:
     }
 
 
+class _FlushingLogger:
+    """
+    Per-job log buffer for handlers running on worker threads.
+    
+    Entries are held locally and handed to the callback batcher at most once
+    per `interval` seconds, so progress shows up steadily without a callback
+    per line. `finish()` sends whatever is left together with the job's
+    final status. Hand-offs happen under the lock so a timer flush can never
+    land after the final status.
+    """
+    
+    def __init__(self, callback_url: str, job_id: str, interval: float = 2.0):
+        self.callback_url = callback_url
+        self.job_id = job_id
+        self.interval = interval
+        self._buffer: List[dict] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+    
+    def log(self, msg_type: str, message: str):
+        with self._lock:
+            self._buffer.append(create_log(msg_type, message))
+            if self._timer is None:
+                self._timer = threading.Timer(self.interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def _take(self) -> List[dict]:
+        """Detach the buffered entries and cancel the pending flush (lock held)"""
+        logs, self._buffer = self._buffer, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return logs
+    
+    def flush(self):
+        with self._lock:
+            logs = self._take()
+            if logs:
+                callback_batcher.submit(self.callback_url, self.job_id, logs=logs)
+    
+    def finish(self, status: str, result: dict = None):
+        with self._lock:
+            callback_batcher.submit(
+                self.callback_url, self.job_id, status, logs=self._take(), result=result
+            )
+
+
+# ============================================================================
+# Dataset Metadata
+# ============================================================================
+
+# Plain tuple snapshots of arcpy.Describe results, so callers read fields
+# without further arcpy attribute access. Reads here are deliberately not
+# memoized: jobs must see current schemas and counts, and the browsing
+# endpoint caches whole listings instead (see _listing_cache).
+FieldInfo = namedtuple("FieldInfo", ["name", "type", "length"])
+DatasetInfo = namedtuple("DatasetInfo", ["shape_type", "spatial_reference", "fields"])
+
+
+def _describe(path: str) -> DatasetInfo:
+    """Shape type, spatial reference name and fields of a dataset"""
+    desc = arcpy.Describe(path)
+    sr = getattr(desc, "spatialReference", None)
+    return DatasetInfo(
+        shape_type=getattr(desc, "shapeType", "Table"),
+        spatial_reference=sr.name if sr else "Unknown",
+        fields=tuple(FieldInfo(f.name, f.type, f.length) for f in desc.fields)
+    )
+
+
+def _fast_count(path: str) -> int:
+    """Row count from the GetCount result object, falling back to an OID cursor scan"""
+    try:
+        return int(arcpy.management.GetCount(path).getOutput(0))
+    except Exception:
+        with arcpy.da.SearchCursor(path, ["OID@"]) as cursor:
+            return sum(1 for _ in cursor)
+
+
 # ============================================================================
 # GDB Extraction
 # ============================================================================
 
+def _extract_feature_class(fc_path: str, output_folder: str, log) -> Optional[dict]:
+    """Export one feature class to a shapefile; returns its result entry, or None on failure"""
+    fc = os.path.basename(fc_path)
+    try:
+        log("info", f"Extracting: {fc}")
+        
+        # Count features
+        count = _fast_count(fc_path)
+        
+        # Export to shapefile
+        output_path = os.path.join(output_folder, f"{fc}.shp")
+        arcpy.conversion.FeatureClassToShapefile(fc_path, output_folder)
+        
+        log("success", f"{fc}: {count} features extracted")
+        
+        # A single stat; a missing output just reports size 0
+        try:
+            size = os.path.getsize(output_path)
+        except OSError:
+            size = 0
+        
+        return {
+            "name": f"{fc}.shp",
+            "type": _describe(fc_path).shape_type,
+            "features": count,
+            "size": size
+        }
+        
+    except Exception as e:
+        log("error", f"Failed to extract {fc}: {str(e)}")
+        return None
+
+
 def run_gdb_extraction(job_id: str, config: dict, callback_url: str):
     """
     Extract feature classes from a File Geodatabase to shapefiles.
     
+    Feature classes are exported concurrently; each export is independent
+    and mostly disk-bound.
+    
     Config:
         - sourceGdbPath: Path to source .gdb
         - outputFolder: Path to output folder
+        - maxWorkers: Concurrent exports (default 4; 1 runs sequentially)
     """
-    import requests
-    
     source_gdb = config.get("sourceGdbPath", "")
     output_folder = config.get("outputFolder", "")
     
-    logs = [create_log("info", "Starting GDB extraction...")]
+    job_logger = _FlushingLogger(callback_url, job_id)
+    log = job_logger.log
+    log("info", "Starting GDB extraction...")
     
     try:
-        # Import arcpy (requires ArcGIS Pro license)
-        import arcpy
+        _require_arcpy()
         
-        logs.append(create_log("info", f"Source GDB: {source_gdb}"))
-        logs.append(create_log("info", f"Output folder: {output_folder}"))
+        log("info", f"Source GDB: {source_gdb}")
+        log("info", f"Output folder: {output_folder}")
         
         # Validate paths
         if not os.path.exists(source_gdb):
@@ -388,179 +796,238 @@ def run_gdb_extraction(job_id: str, config: dict, callback_url: str):
         
         os.makedirs(output_folder, exist_ok=True)
         
-        # Set workspace
-        arcpy.env.workspace = source_gdb
+        # Set the environment once, before any worker starts
+        arcpy.env.overwriteOutput = True
         
-        # Get feature classes
-        feature_classes = arcpy.ListFeatureClasses()
-        logs.append(create_log("info", f"Found {len(feature_classes)} feature classes"))
+        # Walk the geodatabase for absolute feature class paths, including
+        # those inside feature datasets; workers never touch env.workspace
+        feature_classes = [
+            os.path.join(dirpath, name)
+            for dirpath, _, filenames in arcpy.da.Walk(source_gdb, datatype="FeatureClass")
+            for name in filenames
+        ]
+        log("info", f"Found {len(feature_classes)} feature classes")
         
-        # Send running status
-        requests.post(callback_url, json={
-            "jobId": job_id,
-            "status": "running",
-            "logs": logs
-        }, timeout=30)
+        max_workers = max(1, min(int(config.get("maxWorkers", 4)), len(feature_classes)))
         
-        results = []
+        if max_workers == 1:
+            outcomes = [
+                _extract_feature_class(fc_path, output_folder, log)
+                for fc_path in feature_classes
+            ]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                # map() yields results in listing order, so the files table
+                # is stable from run to run
+                outcomes = list(pool.map(
+                    partial(_extract_feature_class, output_folder=output_folder, log=log),
+                    feature_classes
+                ))
         
-        for fc in feature_classes:
-            try:
-                logs.append(create_log("info", f"Extracting: {fc}"))
-                
-                # Count features
-                count = int(arcpy.GetCount_management(fc)[0])
-                
-                # Export to shapefile
-                output_path = os.path.join(output_folder, f"{fc}.shp")
-                arcpy.conversion.FeatureClassToShapefile(fc, output_folder)
-                
-                logs.append(create_log("success", f"{fc}: {count} features extracted"))
-                
-                results.append({
-                    "name": f"{fc}.shp",
-                    "type": arcpy.Describe(fc).shapeType,
-                    "features": count,
-                    "size": os.path.getsize(output_path) if os.path.exists(output_path) else 0
-                })
-                
-            except Exception as e:
-                logs.append(create_log("error", f"Failed to extract {fc}: {str(e)}"))
+        results = [result for result in outcomes if result]
         
-        logs.append(create_log("success", f"Extraction complete! {len(results)} files created."))
+        log("success", f"Extraction complete! {len(results)} files created.")
         
         # Send success callback
-        requests.post(callback_url, json={
-            "jobId": job_id,
-            "status": "success",
-            "logs": logs,
-            "result": {"files": results}
-        }, timeout=30)
+        job_logger.finish("success", result={"files": results})
         
     except ImportError:
-        logs.append(create_log("error", "ArcPy not available. Install ArcGIS Pro."))
-        requests.post(callback_url, json={
-            "jobId": job_id,
-            "status": "failed",
-            "logs": logs
-        }, timeout=30)
+        log("error", "ArcPy not available. Install ArcGIS Pro.")
+        job_logger.finish("failed")
         
     except Exception as e:
-        logs.append(create_log("error", f"Extraction failed: {str(e)}"))
-        requests.post(callback_url, json={
-            "jobId": job_id,
-            "status": "failed",
-            "logs": logs
-        }, timeout=30)
+        log("error", f"Extraction failed: {str(e)}")
+        job_logger.finish("failed")
 
 
 # ============================================================================
 # SDE to SDE Conversion
 # ============================================================================
 
+# arcpy.env is process-global, so the parallel processing factor is shared by
+# every migration running at once: the first one in saves and sets it, the
+# last one out restores it, and overlapping jobs never reset each other
+_parallel_lock = threading.Lock()
+_parallel_holders = 0
+_parallel_saved = None
+
+@contextmanager
+def _parallel_processing(factor: str):
+    global _parallel_holders, _parallel_saved
+    with _parallel_lock:
+        if _parallel_holders == 0:
+            _parallel_saved = arcpy.env.parallelProcessingFactor
+            arcpy.env.parallelProcessingFactor = factor
+        _parallel_holders += 1
+    try:
+        yield
+    finally:
+        with _parallel_lock:
+            _parallel_holders -= 1
+            if _parallel_holders == 0:
+                arcpy.env.parallelProcessingFactor = _parallel_saved
+
+
+def _migrate_feature_class(fc: str, source_count: int, source_conn: str, target_conn: str,
+                           verify_count: bool, log) -> dict:
+    """Copy one feature class to the target SDE; returns its result entry"""
+    try:
+        log("info", f"Migrating: {fc}")
+        
+        # Copy to target; absolute paths keep workers independent of the
+        # process-wide arcpy.env.workspace
+        target_fc = os.path.join(target_conn, fc)
+        arcpy.conversion.FeatureClassToFeatureClass(
+            os.path.join(source_conn, fc), target_conn, fc
+        )
+        
+        # Without verification the target isn't measured, so report no count
+        # rather than echoing the source's
+        if verify_count:
+            target_count = _fast_count(target_fc)
+            status = "success" if source_count == target_count else "warning"
+            log(status, f"{fc}: {source_count} → {target_count} rows")
+        else:
+            target_count = None
+            status = "success"
+            log(status, f"{fc}: {source_count} rows copied")
+        
+        return {
+            "name": fc,
+            "sourceCount": source_count,
+            "targetCount": target_count,
+            "status": status
+        }
+        
+    except Exception as e:
+        log("error", f"Failed to migrate {fc}: {str(e)}")
+        return {
+            "name": fc,
+            "sourceCount": 0,
+            "targetCount": 0,
+            "status": "error"
+        }
+
+
 def run_sde_conversion(job_id: str, config: dict, callback_url: str):
     """
     Migrate feature classes between Enterprise Geodatabases.
     
+    Source feature classes are counted and copied concurrently; large ones
+    are copied one at a time afterwards so they don't compete for the same
+    SDE connections. While any migration runs, arcpy's process-wide
+    parallelProcessingFactor is 75%, so other jobs in the server see it too.
+    
     Config:
         - sourceConnection: Source SDE connection string/path
         - targetConnection: Target SDE connection string/path
         - selectedFeatureClasses: List of feature class IDs to migrate
+        - verifyCount: Re-count each target after copying (default False;
+          FeatureClassToFeatureClass raises on a partial write, so a
+          successful copy already implies matching counts). Unverified
+          results report targetCount as null.
+        - parallelMigrations: Concurrent copies (default 4; 1 runs sequentially)
+        - serialRowThreshold: Feature classes with more rows than this are
+          copied sequentially (default 1,000,000)
     """
-    import requests
-    
     source_conn = config.get("sourceConnection", "")
     target_conn = config.get("targetConnection", "")
     selected_fcs = config.get("selectedFeatureClasses", [])
+    verify_count = config.get("verifyCount", False)
+    parallel_migrations = max(1, int(config.get("parallelMigrations", 4)))
+    serial_threshold = int(config.get("serialRowThreshold", 1_000_000))
     
-    logs = [create_log("info", "Starting SDE to SDE migration...")]
+    job_logger = _FlushingLogger(callback_url, job_id)
+    log = job_logger.log
+    log("info", "Starting SDE to SDE migration...")
     
     try:
-        import arcpy
+        _require_arcpy()
         
-        logs.append(create_log("info", f"Source: {source_conn}"))
-        logs.append(create_log("info", f"Target: {target_conn}"))
-        logs.append(create_log("info", f"Selected feature classes: {len(selected_fcs)}"))
+        log("info", f"Source: {source_conn}")
+        log("info", f"Target: {target_conn}")
+        log("info", f"Selected feature classes: {len(selected_fcs)}")
         
-        # Send running status
-        requests.post(callback_url, json={
-            "jobId": job_id,
-            "status": "running",
-            "logs": logs
-        }, timeout=30)
+        feature_classes, _ = _list_workspace(source_conn)
         
-        arcpy.env.workspace = source_conn
-        feature_classes = arcpy.ListFeatureClasses()
+        # Resolve selected IDs with one dict lookup each instead of scanning
+        # the selection list for every listed feature class
+        if selected_fcs:
+            by_id = {fc.lower().replace(" ", "_"): fc for fc in feature_classes}
+            feature_classes = []
+            for fc_id in dict.fromkeys(selected_fcs):
+                if fc_id in by_id:
+                    feature_classes.append(by_id[fc_id])
+                else:
+                    log("warning", f"Feature class not found in source: {fc_id}")
         
-        results = []
+        results = {}
+        max_workers = max(1, min(parallel_migrations, len(feature_classes)))
         
-        for fc in feature_classes:
-            fc_id = fc.lower().replace(" ", "_")
-            if selected_fcs and fc_id not in selected_fcs:
-                continue
-                
-            try:
-                logs.append(create_log("info", f"Migrating: {fc}"))
-                
-                source_count = int(arcpy.GetCount_management(fc)[0])
+        # Let arcpy spread each copy across cores while any migration runs
+        with _parallel_processing("75%"), \
+                ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # Count every source concurrently, then split by size: small
+            # feature classes go through the pool, large ones run
+            # sequentially after it
+            count_futures = {
+                fc: pool.submit(_fast_count, os.path.join(source_conn, fc))
+                for fc in feature_classes
+            }
+            small, large = [], []
+            for fc, future in count_futures.items():
+                try:
+                    source_count = future.result()
+                except Exception as e:
+                    log("error", f"Failed to migrate {fc}: {str(e)}")
+                    results[fc] = {
+                        "name": fc,
+                        "sourceCount": 0,
+                        "targetCount": 0,
+                        "status": "error"
+                    }
+                    continue
                 
-                # Copy to target
-                target_fc = os.path.join(target_conn, fc)
-                arcpy.conversion.FeatureClassToFeatureClass(
-                    fc, target_conn, fc
+                (large if source_count > serial_threshold else small).append((fc, source_count))
+            
+            futures = {
+                fc: pool.submit(_migrate_feature_class, fc, count, source_conn, target_conn,
+                                verify_count, log)
+                for fc, count in small
+            }
+            for fc, future in futures.items():
+                results[fc] = future.result()
+            
+            for fc, count in large:
+                results[fc] = _migrate_feature_class(
+                    fc, count, source_conn, target_conn, verify_count, log
                 )
-                
-                target_count = int(arcpy.GetCount_management(target_fc)[0])
-                
-                status = "success" if source_count == target_count else "warning"
-                logs.append(create_log(status, f"{fc}: {source_count} → {target_count} rows"))
-                
-                results.append({
-                    "name": fc,
-                    "sourceCount": source_count,
-                    "targetCount": target_count,
-                    "status": status
-                })
-                
-            except Exception as e:
-                logs.append(create_log("error", f"Failed to migrate {fc}: {str(e)}"))
-                results.append({
-                    "name": fc,
-                    "sourceCount": 0,
-                    "targetCount": 0,
-                    "status": "error"
-                })
-        
-        logs.append(create_log("success", f"Migration complete! {len(results)} feature classes processed."))
-        
-        requests.post(callback_url, json={
-            "jobId": job_id,
-            "status": "success",
-            "logs": logs,
-            "result": {"migrations": results}
-        }, timeout=30)
+        
+        # Report in listing order, however the copies were scheduled
+        migrations = [results[fc] for fc in feature_classes]
+        
+        log("success", f"Migration complete! {len(migrations)} feature classes processed.")
+        
+        job_logger.finish("success", result={"migrations": migrations})
         
     except ImportError:
-        logs.append(create_log("error", "ArcPy not available. Install ArcGIS Pro."))
-        requests.post(callback_url, json={
-            "jobId": job_id,
-            "status": "failed",
-            "logs": logs
-        }, timeout=30)
+        log("error", "ArcPy not available. Install ArcGIS Pro.")
+        job_logger.finish("failed")
         
     except Exception as e:
-        logs.append(create_log("error", f"Migration failed: {str(e)}"))
-        requests.post(callback_url, json={
-            "jobId": job_id,
-            "status": "failed",
-            "logs": logs
-        }, timeout=30)
+        log("error", f"Migration failed: {str(e)}")
+        job_logger.finish("failed")
 
 
 # ============================================================================
 # Feature Class Comparison
 # ============================================================================
 
+def _type_label(field_type: str, length: int) -> str:
+    """Display form of a field type, e.g. 'String(50)'"""
+    return f"{field_type}({length})" if length else field_type
+
+
 def run_comparison(job_id: str, config: dict, callback_url: str):
     """
     Compare schema, attributes, or spatial properties between datasets.
@@ -570,114 +1037,99 @@ def run_comparison(job_id: str, config: dict, callback_url: str):
         - targetConnection: Target feature class path
         - comparisonType: 'schema', 'attribute', or 'spatial'
     """
-    import requests
-    
     source = config.get("sourceConnection", "")
     target = config.get("targetConnection", "")
     comparison_type = config.get("comparisonType", "schema")
     
-    logs = [create_log("info", f"Starting {comparison_type} comparison...")]
+    job_logger = _FlushingLogger(callback_url, job_id)
+    log = job_logger.log
+    log("info", f"Starting {comparison_type} comparison...")
     
     try:
-        import arcpy
-        
-        logs.append(create_log("info", f"Source: {source}"))
-        logs.append(create_log("info", f"Target: {target}"))
+        _require_arcpy()
         
-        # Send running status
-        requests.post(callback_url, json={
-            "jobId": job_id,
-            "status": "running",
-            "logs": logs
-        }, timeout=30)
+        log("info", f"Source: {source}")
+        log("info", f"Target: {target}")
         
-        # Get feature counts
-        source_count = int(arcpy.GetCount_management(source)[0])
-        target_count = int(arcpy.GetCount_management(target)[0])
-        
-        logs.append(create_log("success", f"Source: {source_count} features"))
-        logs.append(create_log("success", f"Target: {target_count} features"))
-        
-        if source_count != target_count:
-            diff = target_count - source_count
-            sign = "+" if diff > 0 else ""
-            logs.append(create_log("warning", f"Feature count mismatch ({sign}{diff})"))
+        # Feature counts; a schema diff doesn't use them, so skip the scans
+        if comparison_type != "schema":
+            source_count = _fast_count(source)
+            target_count = _fast_count(target)
+            
+            log("success", f"Source: {source_count} features")
+            log("success", f"Target: {target_count} features")
+            
+            if source_count != target_count:
+                diff = target_count - source_count
+                sign = "+" if diff > 0 else ""
+                log("warning", f"Feature count mismatch ({sign}{diff})")
         
         results = []
         
         if comparison_type == "schema":
-            # Compare field definitions
-            source_fields = {f.name: f for f in arcpy.ListFields(source)}
-            target_fields = {f.name: f for f in arcpy.ListFields(target)}
+            # Compare field definitions on the plain (type, length) snapshots;
+            # type strings are only formatted for the rows that report them
+            source_fields = {f.name: (f.type, f.length or 0) for f in _describe(source).fields}
+            target_fields = {f.name: (f.type, f.length or 0) for f in _describe(target).fields}
             
-            all_fields = set(source_fields.keys()) | set(target_fields.keys())
+            # (name, definition) pairs present on only one side: every field that
+            # is missing somewhere or whose type differs, found in one set operation
+            mismatched = {name for name, _ in source_fields.items() ^ target_fields.items()}
             
-            for field_name in all_fields:
-                src_field = source_fields.get(field_name)
-                tgt_field = target_fields.get(field_name)
-                
-                if src_field and tgt_field:
-                    src_type = f"{src_field.type}({src_field.length})" if src_field.length else src_field.type
-                    tgt_type = f"{tgt_field.type}({tgt_field.length})" if tgt_field.length else tgt_field.type
-                    
-                    match = src_type == tgt_type
-                    diff = None if match else "Type differs"
-                    
+            for field_name in source_fields.keys() | target_fields.keys():
+                if field_name not in mismatched:
+                    # Identical definitions, so one label serves both sides
+                    label = _type_label(*source_fields[field_name])
                     results.append({
                         "field": field_name,
-                        "sourceValue": src_type,
-                        "targetValue": tgt_type,
-                        "match": match,
-                        "difference": diff
+                        "sourceValue": label,
+                        "targetValue": label,
+                        "match": True,
+                        "difference": None
                     })
-                elif src_field:
+                elif field_name not in target_fields:
                     results.append({
                         "field": field_name,
-                        "sourceValue": src_field.type,
+                        "sourceValue": source_fields[field_name][0],
                         "targetValue": "N/A",
                         "match": False,
                         "difference": "Missing in target"
                     })
-                else:
+                elif field_name not in source_fields:
                     results.append({
                         "field": field_name,
                         "sourceValue": "N/A",
-                        "targetValue": tgt_field.type,
+                        "targetValue": target_fields[field_name][0],
                         "match": False,
                         "difference": "Missing in source"
                     })
+                else:
+                    results.append({
+                        "field": field_name,
+                        "sourceValue": _type_label(*source_fields[field_name]),
+                        "targetValue": _type_label(*target_fields[field_name]),
+                        "match": False,
+                        "difference": "Type differs"
+                    })
             
             match_count = sum(1 for r in results if r["match"])
-            logs.append(create_log("success", f"Schema: {match_count}/{len(results)} fields match"))
+            log("success", f"Schema: {match_count}/{len(results)} fields match")
         
-        logs.append(create_log("success", "Comparison complete!"))
+        log("success", "Comparison complete!")
         
-        requests.post(callback_url, json={
-            "jobId": job_id,
-            "status": "success",
-            "logs": logs,
-            "result": {"comparisons": results}
-        }, timeout=30)
+        job_logger.finish("success", result={"comparisons": results})
         
     except ImportError:
-        logs.append(create_log("error", "ArcPy not available. Install ArcGIS Pro."))
-        requests.post(callback_url, json={
-            "jobId": job_id,
-            "status": "failed",
-            "logs": logs
-        }, timeout=30)
+        log("error", "ArcPy not available. Install ArcGIS Pro.")
+        job_logger.finish("failed")
         
     except Exception as e:
-        logs.append(create_log("error", f"Comparison failed: {str(e)}"))
-        requests.post(callback_url, json={
-            "jobId": job_id,
-            "status": "failed",
-            "logs": logs
-        }, timeout=30)
+        log("error", f"Comparison failed: {str(e)}")
+        job_logger.finish("failed")
 
 
 @app.post("/execute")
-async def execute_script(request: ExecuteRequest, background_tasks: BackgroundTasks):
+async def execute_script(request: ExecuteRequest):
     """
     Execute a GIS automation script.
     
@@ -701,11 +1153,9 @@ async def execute_script(request: ExecuteRequest, background_tasks: BackgroundTa
     if not handler:
         raise HTTPException(status_code=400, detail=f"Unknown job type: {job_type}")
     
-    # Run in background thread (ArcPy is blocking)
-    def run_job():
-        handler(job_id, config, callback_url)
-    
-    background_tasks.add_task(lambda: executor.submit(run_job))
+    # Run on the job pool (ArcPy is blocking); submitted directly so the job
+    # starts without first waiting on a BackgroundTasks thread
+    _job_executor.submit(handler, job_id, config, callback_url)
     
     return {"status": "accepted", "jobId": job_id}
 
@@ -737,8 +1187,7 @@ class UserResponse(BaseModel):
 async def signup(request: SignUpRequest, db: Session = Depends(get_db)):
     """Register a new user"""
     # Check if email already exists
-    existing_user = db.query(User).filter(User.email == request.email).first()
-    if existing_user:
+    if await _offload(email_registered, db, request.email):
         raise HTTPException(status_code=400, detail="Email already registered")
     
     # Validate email format
@@ -749,12 +1198,13 @@ async def signup(request: SignUpRequest, db: Session = Depends(get_db)):
     if len(request.password) < 6:
         raise HTTPException(status_code=400, detail="Password must be at least 6 characters")
     
-    # Create user
-    user_id = secrets.token_hex(16)
+    # Create user (bcrypt is CPU-heavy, so hash off the event loop)
+    user_id = new_user_id()
+    password_hash = await _offload_auth(hash_password, request.password)
     user = User(
         id=user_id,
         email=request.email,
-        password_hash=hash_password(request.password),
+        password_hash=password_hash,
         full_name=request.full_name,
         created_at=datetime.utcnow()
     )
@@ -778,12 +1228,12 @@ async def signup(request: SignUpRequest, db: Session = Depends(get_db)):
 @app.post("/auth/signin", response_model=AuthResponse)
 async def signin(request: SignInRequest, db: Session = Depends(get_db)):
     """Sign in an existing user"""
-    user = db.query(User).filter(User.email == request.email).first()
+    user = await _offload(get_signin_row, db, request.email)
     
     if not user:
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
-    if not verify_password(request.password, user.password_hash):
+    if not await _offload_auth(verify_password, request.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
     if not user.is_active:
@@ -832,48 +1282,101 @@ class FeatureClassListResponse(BaseModel):
     feature_classes: List[FeatureClassItem]
     tables: List[str]
 
+# Full listings keyed by (gdb path, .gdb folder mtime): dashboards poll the
+# same geodatabases. Adding or removing a table moves the mtime and misses;
+# in-place edits don't, so entries also expire after LISTING_CACHE_SECONDS
+# and are rebuilt from fresh Describe/GetCount reads.
+LISTING_CACHE_SECONDS = 60
+_listing_cache = TTLCache(maxsize=128, ttl=LISTING_CACHE_SECONDS)
+
+def _list_workspace(path: str) -> Tuple[List[str], List[str]]:
+    """
+    Top-level feature class and table names in a workspace (blocking).
+    
+    Reads the workspace's Describe children rather than setting the
+    process-wide arcpy.env.workspace, so concurrent callers can't list each
+    other's geodatabases.
+    """
+    _require_arcpy()
+    
+    feature_classes, tables = [], []
+    for child in arcpy.Describe(path).children:
+        if child.dataType == "FeatureClass":
+            feature_classes.append(child.name)
+        elif child.dataType == "Table":
+            tables.append(child.name)
+    return feature_classes, tables
+
+def _describe_and_count(gdb_path: str, fc: str) -> Optional[FeatureClassItem]:
+    """Metadata for one feature class, or None if it can't be read (blocking)"""
+    try:
+        fc_path = os.path.join(gdb_path, fc)
+        info = _describe(fc_path)
+        count = _fast_count(fc_path)
+        
+        return FeatureClassItem(
+            name=fc,
+            type=info.shape_type,
+            feature_count=count,
+            spatial_reference=info.spatial_reference
+        )
+    except Exception as e:
+        logger.warning(f"Error reading feature class {fc}: {e}")
+        return None
+
+# Feature classes of one listing are described and counted on a small pool
+# of their own, so a large geodatabase can't occupy the shared executor
+LISTING_WORKERS = 4
+
+def _read_listing(gdb_path: str) -> Tuple[List[Optional[FeatureClassItem]], List[str]]:
+    """Metadata for every feature class plus the table names (blocking)"""
+    fc_names, tables = _list_workspace(gdb_path)
+    if not fc_names:
+        return [], tables
+    
+    with ThreadPoolExecutor(max_workers=min(LISTING_WORKERS, len(fc_names))) as pool:
+        items = list(pool.map(partial(_describe_and_count, gdb_path), fc_names))
+    return items, tables
+
 @app.post("/list-feature-classes", response_model=FeatureClassListResponse)
 async def list_feature_classes(path: str):
     """
     List all feature classes and tables in a geodatabase.
+    
+    ArcPy calls block, so the whole read is one call on the executor; within
+    it, feature classes are described and counted on a small local pool.
     """
     if not path:
         raise HTTPException(status_code=400, detail="Path is required")
     
-    if not os.path.exists(path):
+    # One stat answers "exists", "is a directory" and the cache version
+    try:
+        st = os.stat(path)
+    except OSError:
         raise HTTPException(status_code=404, detail=f"Path not found: {path}")
     
-    if not is_geodatabase(path):
+    if not (path.lower().endswith('.gdb') and stat.S_ISDIR(st.st_mode)):
         raise HTTPException(status_code=400, detail="Path must be a geodatabase (.gdb)")
     
+    cache_key = (path, st.st_mtime)
+    cached = _listing_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        import arcpy
-        
-        arcpy.env.workspace = path
+        items, tables = await _offload(_read_listing, path)
+        feature_classes = [item for item in items if item is not None]
         
-        feature_classes = []
-        for fc in arcpy.ListFeatureClasses() or []:
-            try:
-                desc = arcpy.Describe(fc)
-                count = int(arcpy.GetCount_management(fc)[0])
-                sr = desc.spatialReference.name if desc.spatialReference else "Unknown"
-                
-                feature_classes.append(FeatureClassItem(
-                    name=fc,
-                    type=desc.shapeType,
-                    feature_count=count,
-                    spatial_reference=sr
-                ))
-            except Exception as e:
-                logger.warning(f"Error reading feature class {fc}: {e}")
-        
-        tables = arcpy.ListTables() or []
-        
-        return FeatureClassListResponse(
+        response = FeatureClassListResponse(
             gdb_path=path,
             feature_classes=feature_classes,
             tables=list(tables)
         )
+        # A feature class that couldn't be read (e.g. briefly locked) would
+        # otherwise stay missing for the life of the entry
+        if len(feature_classes) == len(items):
+            _listing_cache[cache_key] = response
+        return response
         
     except ImportError:
         # Mock data for testing without ArcPy
@@ -901,16 +1404,9 @@ async def list_feature_classes(path: str):
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    arcpy_available = False
-    try:
-        import arcpy
-        arcpy_available = True
-    except ImportError:
-        pass
-    
     return {
         "status": "healthy",
-        "arcpy_available": arcpy_available,
+        "arcpy_available": _HAS_ARCPY,
         "timestamp": datetime.utcnow().isoformat()
     }
 
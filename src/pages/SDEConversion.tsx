@@ -15,7 +15,7 @@ import { useLocalStorage } from '@/hooks/useLocalStorage';
 interface MigrationResult {
   name: string;
   sourceCount: number;
-  targetCount: number;
+  targetCount: number | null;
   status: 'success' | 'warning' | 'error';
 }
 
@@ -92,13 +92,18 @@ export default function SDEConversion() {
   const columns = [
     { key: 'name', header: 'Feature Class', className: 'font-medium' },
     { key: 'sourceCount', header: 'Source Rows', className: 'text-right font-mono' },
-    { key: 'targetCount', header: 'Target Rows', className: 'text-right font-mono' },
+    {
+      key: 'targetCount',
+      header: 'Target Rows',
+      className: 'text-right font-mono',
+      render: (item: MigrationResult) => item.targetCount ?? '—',
+    },
     {
       key: 'status',
       header: 'Status',
       render: (item: MigrationResult) => (
         <span className={`status-badge ${item.status === 'success' ? 'status-success' : 'status-failed'}`}>
-          {item.status === 'success' ? 'Verified' : 'Mismatch'}
+          {item.status !== 'success' ? 'Mismatch' : item.targetCount === null ? 'Copied' : 'Verified'}
         </span>
       ),
     },